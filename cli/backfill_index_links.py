@@ -6,16 +6,20 @@ using the repository setting from cli/config.py.
 Usage:
     python cli/backfill_index_links.py
 
-This will update every row to ensure links are full GitHub URLs pointing to:
+This will update any row whose links are not full GitHub URLs pointing to:
   - logs/<date>/<filename>
   - logs/<date>/<metadata_file>
+
+The index is left untouched when every link is already correct.
 """
 
 from __future__ import annotations
 
 import csv
+import os
 import sys
 from pathlib import Path
+from typing import Iterator
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -28,6 +32,53 @@ except Exception:  # pragma: no cover
     print("Error: Unable to import cli.config. Ensure you run from the repo root.")
     sys.exit(1)
 
+# The capture CLI's index lock, so a backfill never interleaves with its flushes
+from cli.interactive_capture import index_lock
+
+# Blob URL prefixes for index links (main() refuses to run if GITHUB_REPO is empty)
+_LINK_PREFIX = f"https://github.com/{GITHUB_REPO}/blob/main/"
+_LOGS_LINK_PREFIX = _LINK_PREFIX + "logs/"
+
+
+# Required columns, looked up by name so any column order is accepted
+REQUIRED_COLUMNS = [
+    "date",
+    "filename",
+    "metadata_file",
+    "log_link",
+    "metadata_link",
+]
+
+
+def link_rows(reader: Iterator[list[str]], header: list[str]) -> Iterator[tuple[list[str], bool]]:
+    """Yield each data row with its links filled in, and whether they changed."""
+    col_date, col_filename, col_metadata_file, col_log_link, col_metadata_link = (
+        header.index(c) for c in REQUIRED_COLUMNS
+    )
+    width = len(header)
+
+    # Rows share a handful of dates, so cache the per-date prefix; names come
+    # from controlled scenario IDs and need no path normalization.
+    date_prefixes: dict[str, str] = {}
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        date_str = row[col_date].strip()
+
+        date_prefix = date_prefixes.get(date_str)
+        if date_prefix is None:
+            date_prefix = date_prefixes[date_str] = _LOGS_LINK_PREFIX + date_str + "/"
+
+        log_link = date_prefix + row[col_filename].strip()
+        metadata_link = date_prefix + row[col_metadata_file].strip()
+        changed = row[col_log_link] != log_link or row[col_metadata_link] != metadata_link
+        if changed:
+            row[col_log_link] = log_link
+            row[col_metadata_link] = metadata_link
+        yield row, changed
+
 
 def main() -> int:
     if not GITHUB_REPO:
@@ -39,48 +90,41 @@ def main() -> int:
         print(f"No index file found or it is empty: {index_path}")
         return 0
 
-    # Read existing rows
-    with open(index_path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
-        rows = list(reader)
-
-    # Ensure required columns exist in header
-    required = {
-        "date",
-        "filename",
-        "metadata_file",
-        "log_link",
-        "metadata_link",
-    }
-    missing = [c for c in required if c not in fieldnames]
-    if missing:
-        print(
-            "Error: CSV is missing required columns: " + ", ".join(missing) +
-            ". Please ensure header matches README."
-        )
-        return 1
-
-    # Update links
-    for row in rows:
-        date_str = row.get("date", "").strip()
-        filename = row.get("filename", "").strip()
-        metadata_file = row.get("metadata_file", "").strip()
-
-        # Build POSIX-style relative paths
-        log_rel = Path("logs") / date_str / filename
-        meta_rel = Path("logs") / date_str / metadata_file
-
-        row["log_link"] = f"https://github.com/{GITHUB_REPO}/blob/main/{log_rel.as_posix()}"
-        row["metadata_link"] = f"https://github.com/{GITHUB_REPO}/blob/main/{meta_rel.as_posix()}"
-
-    # Write back
-    with open(index_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"Updated links for {len(rows)} row(s) in {index_path}")
+    # Hold the lock from the first read until the replace, so a capture
+    # session cannot write the index in between (and the .tmp path is ours)
+    with index_lock(index_path):
+        # Read-only pass: validate the header and stop at the first stale link
+        with open(index_path, "r", newline="", encoding="utf-8") as src:
+            reader = csv.reader(src)
+            header = next(reader, [])
+            missing = [c for c in REQUIRED_COLUMNS if c not in header]
+            if missing:
+                print(
+                    "Error: CSV is missing required columns: " + ", ".join(missing) +
+                    ". Please ensure header matches README."
+                )
+                return 1
+            if not any(changed for _, changed in link_rows(reader, header)):
+                # Leave the file (and its mtime) untouched
+                print(f"Index already up-to-date: {index_path}")
+                return 0
+
+        # Stream rows into a tempfile, then swap it into place
+        tmp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+        count = 0
+        with open(index_path, "r", newline="", encoding="utf-8") as src, open(
+            tmp_path, "w", newline="", encoding="utf-8"
+        ) as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            writer.writerow(next(reader))
+            for row, changed in link_rows(reader, header):
+                writer.writerow(row)
+                count += changed
+
+        os.replace(tmp_path, index_path)
+
+    print(f"Updated links for {count} row(s) in {index_path}")
     return 0
 
 
@@ -8,10 +8,13 @@ Flow:
  3) Prompt for required fields with validation and optional nulls
  4) Verify `capture/capture.txt` exists (fixed path), prompt user to place it if missing
  5) Move capture into logs/YYYY-MM-DD/SCN_YYYY_MM_DD_XXX.log
- 6) Write metadata JSON alongside
+ 6) Write metadata JSON alongside (and append it to index/metadata.jsonl)
  7) Update master index CSV
  8) Show a summary of actions and results
 
+Batch mode (`--batch`) skips the prompts and processes CSV records from stdin
+in one process; see `process_capture_many`.
+
 Notes:
  - Designed to be run from anywhere; paths are resolved relative to the repo root
  - Validation ranges are intentionally generous but catch common typos
@@ -20,14 +23,23 @@ Notes:
 from __future__ import annotations
 
 import csv
+import errno
+import io
+import json
+import os
 import re
-import shutil
 import sys
-import subprocess
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+
+try:
+    import fcntl  # POSIX only; used to lock the index during writes
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
 
 
 # --------------------------- Configuration ---------------------------------
@@ -48,12 +60,68 @@ except Exception:
         # Fallback default if config cannot be imported
         REPO_GITHUB_PATH = ""
 
+# Blob URL prefixes for index links; empty when links are disabled
+_LINK_PREFIX = f"https://github.com/{REPO_GITHUB_PATH}/blob/main/" if REPO_GITHUB_PATH else ""
+_LOGS_LINK_PREFIX = _LINK_PREFIX + "logs/" if _LINK_PREFIX else ""
+
+# Set CLI_YES=1 to accept the default answer of every yes/no confirmation,
+# e.g. when driving the CLI from a script
+NONINTERACTIVE = os.environ.get("CLI_YES") == "1"
+
 # Validation ranges (inclusive)
 VOLTAGE_MIN, VOLTAGE_MAX = 0.0, 120.0
 THROTTLE_MIN, THROTTLE_MAX = 0.0, 5.0
 CTRL_TEMP_MIN, CTRL_TEMP_MAX = -20, 120
 MOTOR_TEMP_MIN, MOTOR_TEMP_MAX = -20, 150
 
+# Column order of index/master_log_index.csv (see README)
+INDEX_FIELDNAMES = [
+    "date",
+    "filename",
+    "file_size",
+    "record_count",
+    "metadata_file",
+    "created_at",
+    "test_description",
+    "log_link",
+    "metadata_link",
+]
+(
+    COL_DATE,
+    COL_FILENAME,
+    COL_FILE_SIZE,
+    COL_RECORD_COUNT,
+    COL_METADATA_FILE,
+    COL_CREATED_AT,
+    COL_TEST_DESCRIPTION,
+    COL_LOG_LINK,
+    COL_METADATA_LINK,
+) = range(len(INDEX_FIELDNAMES))
+
+
+# Accepted numeric input for the prompt helpers
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)")
+_INT_RE = re.compile(r"[-+]?\d+")
+
+# Matches scenario IDs SCN_YYYY_MM_DD_XXX; groups are the date token and index
+_SCENARIO_ID_RE = re.compile(r"^SCN_(\d{4}_\d{2}_\d{2})_(\d{3})$")
+
+# Blank log content: the ASCII whitespace str.strip() removes, minus line
+# breaks. Logs are split into lines like text-mode reads (universal newlines),
+# so "\r\n", a bare "\r" and "\n" each end a line. The *_LINE_RE patterns
+# match a line break followed by a blank (or whitespace-only) line.
+# _BLANK_LF_LINE_RE handles chunks whose breaks are all "\n" or "\r\n", and
+# _BLANK_CR_LINE_RE chunks with only bare "\r"; anchoring on a literal break
+# character keeps those common cases fast.
+_BLANK_RE = re.compile(rb"[ \t\x0b\x0c\x1c-\x1f]*")
+_BLANK_LF_LINE_RE = re.compile(rb"\n[ \t\x0b\x0c\x1c-\x1f]*\r?(?=\n)")
+_BLANK_CR_LINE_RE = re.compile(rb"\r[ \t\x0b\x0c\x1c-\x1f]*(?=\r)")
+_BLANK_LINE_RE = re.compile(rb"(?:\r\n|\r(?!\n)|\n)[ \t\x0b\x0c\x1c-\x1f]*(?=[\r\n])")
+
+
+# Directories created (or confirmed to exist) by ensure_dir in this process
+_CREATED_DIRS: set[Path] = set()
+
 
 # ---------------------------- Data Models ----------------------------------
 
@@ -69,6 +137,21 @@ class MetadataInputs:
     pas_level: int
 
 
+@dataclass
+class IndexBatch:
+    """In-memory copy of the master index, written back once per session."""
+    path: Path
+    header: list[str]
+    rows: list[list]
+    positions: dict[str, int]  # filename -> position in rows
+    stamp: tuple[int, int] = (0, 0)  # index (mtime_ns, size) when last read or written
+    lineterminator: str = "\n"  # line ending used by the file, kept on write
+    dirty: bool = False
+    rewrite: bool = False  # an existing row changed, or the file needs a header
+    pending: list[bytes] = field(default_factory=list)  # serialized new rows
+    touched: dict[str, list] = field(default_factory=dict)  # filename -> row patched since last flush
+
+
 # ---------------------------- Utilities ------------------------------------
 
 def get_project_root() -> Path:
@@ -77,10 +160,55 @@ def get_project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def read_input(prompt: str) -> str:
+    """Print a prompt and return one stripped line from stdin.
+
+    Interactive terminals keep using input() for line editing. Piped stdin is
+    read directly with sys.stdin.readline, which is cheaper per prompt when a
+    script feeds many answers. Raises EOFError when input is exhausted.
+    """
+    if sys.stdin.isatty():
+        return input(prompt).strip()
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+@lru_cache(maxsize=32)
+def logs_dir_for(project_root: Path, date_str: str) -> Path:
+    """Return logs/YYYY-MM-DD/ for a date, reusing the Path across a session."""
+    return project_root / "logs" / date_str
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process.
+
+    Directories already created or confirmed by this process are remembered,
+    so repeated scenarios for the same date skip the mkdir syscalls.
+    """
+    if path in _CREATED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+def file_size_or_none(path: Path) -> Optional[int]:
+    """Return the file size from a single stat() call, or None if it is missing."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
 def prompt_yes_no(message: str, default: bool = True) -> bool:
+    if NONINTERACTIVE:
+        return default
     suffix = "[Y/n]" if default else "[y/N]"
     while True:
-        response = input(f"{message} {suffix} ").strip().lower()
+        response = read_input(f"{message} {suffix} ").lower()
         if response == "" and default is not None:
             return default
         if response in {"y", "yes"}:
@@ -93,7 +221,7 @@ def prompt_yes_no(message: str, default: bool = True) -> bool:
 def prompt_str(message: str, allow_empty: bool = False, default: Optional[str] = None) -> str:
     while True:
         hint = f" [{default}]" if default is not None else ""
-        val = input(f"{message}{hint} ").strip()
+        val = read_input(f"{message}{hint} ")
         if val == "" and default is not None:
             return default
         if val or allow_empty:
@@ -106,18 +234,17 @@ def prompt_float_optional(message: str, min_value: float, max_value: float, defa
         hint = " (blank for null)"
         if default is not None:
             hint = f" [default={default}] (Enter=reuse, 'null'=null)"
-        raw = input(f"{message}{hint} ").strip().lower()
+        raw = read_input(f"{message}{hint} ").lower()
         if raw == "" and default is not None:
             return default
         if raw == "":
             return None
         if raw == "null":
             return None
-        try:
-            val = float(raw)
-        except ValueError:
+        if not _NUMBER_RE.fullmatch(raw):
             print("Please enter a number or leave blank.")
             continue
+        val = float(raw)
         if val < min_value or val > max_value:
             print(f"Value out of range ({min_value} to {max_value}). Try again.")
             continue
@@ -129,18 +256,17 @@ def prompt_int_optional(message: str, min_value: int, max_value: int, default: O
         hint = " (blank for null)"
         if default is not None:
             hint = f" [default={default}] (Enter=reuse, 'null'=null)"
-        raw = input(f"{message}{hint} ").strip().lower()
+        raw = read_input(f"{message}{hint} ").lower()
         if raw == "" and default is not None:
             return default
         if raw == "":
             return None
         if raw == "null":
             return None
-        try:
-            val = int(raw)
-        except ValueError:
+        if not _INT_RE.fullmatch(raw):
             print("Please enter an integer or leave blank.")
             continue
+        val = int(raw)
         if val < min_value or val > max_value:
             print(f"Value out of range ({min_value} to {max_value}). Try again.")
             continue
@@ -151,14 +277,13 @@ def prompt_int_range(message: str, min_value: int, max_value: int, default: Opti
     """Prompt for a required integer within range. If default provided, Enter reuses it."""
     while True:
         hint = f" [{default}]" if default is not None else ""
-        raw = input(f"{message}{hint} ").strip()
+        raw = read_input(f"{message}{hint} ")
         if raw == "" and default is not None:
             return default
-        try:
-            val = int(raw)
-        except ValueError:
+        if not _INT_RE.fullmatch(raw):
             print("Please enter an integer.")
             continue
+        val = int(raw)
         if val < min_value or val > max_value:
             print(f"Value out of range ({min_value} to {max_value}). Try again.")
             continue
@@ -197,49 +322,72 @@ def parse_time(prompt_label: str, default_time: Optional[datetime] = None) -> st
             print("Invalid time format. Please use HH:MM (24-hour).")
 
 
-def generate_scenario_id(for_date: str, logs_dir: Path) -> str:
+def scan_scenarios(logs_dir: Path) -> tuple[set[str], set[str]]:
+    """Walk logs/YYYY-MM-DD/ once and return (ids_with_log, ids_with_metadata).
+
+    IDs are file names without the .log / .metadata.json extension. A missing
+    directory yields two empty sets.
+    """
+    log_ids: set[str] = set()
+    metadata_ids: set[str] = set()
+    try:
+        with os.scandir(logs_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".log"):
+                    log_ids.add(name[: -len(".log")])
+                elif name.endswith(".metadata.json"):
+                    metadata_ids.add(name[: -len(".metadata.json")])
+    except FileNotFoundError:
+        pass
+    return log_ids, metadata_ids
+
+
+def generate_scenario_id(
+    for_date: str,
+    logs_dir: Path,
+    scan: Optional[tuple[set[str], set[str]]] = None,
+) -> str:
     """Generate next scenario ID SCN_YYYY_MM_DD_XXX for given date.
 
-    Scans existing .log files within logs/YYYY-MM-DD/ to determine the next index.
+    Uses existing .log files within logs/YYYY-MM-DD/ to determine the next index.
+    Pass a `scan_scenarios` result to reuse an earlier directory walk.
     """
+    log_ids, _ = scan if scan is not None else scan_scenarios(logs_dir)
     date_token = for_date.replace("-", "_")
     prefix = f"SCN_{date_token}_"
     next_idx = 1
-    if logs_dir.exists():
-        pattern = re.compile(rf"^SCN_{re.escape(date_token)}_(\d{{3}})\.log$")
-        for path in logs_dir.glob("*.log"):
-            m = pattern.match(path.name)
-            if m:
-                try:
-                    idx = int(m.group(1))
-                    if idx >= next_idx:
-                        next_idx = idx + 1
-                except ValueError:
-                    continue
+    for sid in log_ids:
+        m = _SCENARIO_ID_RE.match(sid)
+        if m and m.group(1) == date_token:
+            idx = int(m.group(2))
+            if idx >= next_idx:
+                next_idx = idx + 1
     return f"{prefix}{next_idx:03d}"
 
 
-def list_metadata_only_scenarios(logs_dir: Path, for_date: str) -> list[str]:
+def list_metadata_only_scenarios(
+    logs_dir: Path,
+    for_date: str,
+    scan: Optional[tuple[set[str], set[str]]] = None,
+) -> list[str]:
     """Return scenario IDs for which a metadata file exists but the log file does not."""
-    candidates: list[str] = []
-    if not logs_dir.exists():
-        return candidates
-    for metadata_path in logs_dir.glob("*.metadata.json"):
-        scenario_id = metadata_path.stem.replace(".metadata", "")
-        log_path = logs_dir / f"{scenario_id}.log"
-        if not log_path.exists():
-            # Only consider scenarios matching the date prefix
-            date_token = for_date.replace("-", "_")
-            if scenario_id.startswith(f"SCN_{date_token}_"):
-                candidates.append(scenario_id)
+    log_ids, metadata_ids = scan if scan is not None else scan_scenarios(logs_dir)
+
+    # Only consider scenarios matching the date prefix, paired with their
+    # numeric suffix so the sort compares plain tuples
+    date_prefix = f"SCN_{for_date.replace('-', '_')}_"
+    pairs: list[tuple[int, str]] = []
+    for sid in metadata_ids - log_ids:
+        if sid.startswith(date_prefix):
+            try:
+                pairs.append((int(sid.rsplit("_", 1)[-1]), sid))
+            except ValueError:
+                pairs.append((0, sid))
+
     # Sort by numeric suffix ascending
-    def suffix_num(sid: str) -> int:
-        try:
-            return int(sid.rsplit("_", 1)[-1])
-        except Exception:
-            return 0
-    candidates.sort(key=suffix_num)
-    return candidates
+    pairs.sort()
+    return [sid for _, sid in pairs]
 
 
 def prompt_select_from_list(title: str, options: list[str]) -> Optional[str]:
@@ -252,7 +400,7 @@ def prompt_select_from_list(title: str, options: list[str]) -> Optional[str]:
         print(f"  {idx}) {opt}")
     print("  0) Create a new scenario ID")
     while True:
-        choice = input("Select an option [0..{n}]: ".format(n=len(options))).strip()
+        choice = read_input("Select an option [0..{n}]: ".format(n=len(options)))
         if choice == "0" or choice == "":
             return None
         try:
@@ -267,7 +415,8 @@ def prompt_select_from_list(title: str, options: list[str]) -> Optional[str]:
 
 def choose_or_generate_scenario_id(for_date: str, logs_dir: Path) -> str:
     """Offer reuse of metadata-only scenarios for the date, else generate next ID."""
-    existing = list_metadata_only_scenarios(logs_dir, for_date)
+    scan = scan_scenarios(logs_dir)
+    existing = list_metadata_only_scenarios(logs_dir, for_date, scan)
     if len(existing) == 1:
         reuse = prompt_yes_no(
             f"Reuse existing metadata-only scenario '{existing[0]}' for this date?",
@@ -282,7 +431,7 @@ def choose_or_generate_scenario_id(for_date: str, logs_dir: Path) -> str:
         if selected:
             return selected
     # Fallback: create a new one
-    return generate_scenario_id(for_date, logs_dir)
+    return generate_scenario_id(for_date, logs_dir, scan)
 
 
 def ensure_capture_available(capture_path: Path) -> tuple[str, Optional[Path]]:
@@ -296,33 +445,34 @@ def ensure_capture_available(capture_path: Path) -> tuple[str, Optional[Path]]:
     """
     print(f"Expected capture file at: {capture_path}")
     while True:
-        if capture_path.exists():
-            size = capture_path.stat().st_size
+        size = file_size_or_none(capture_path)
+        if size is not None:
             print(f"Found capture.txt ({size} bytes).")
             if size == 0:
                 print("Warning: capture.txt is empty (0 bytes).")
-            if prompt_yes_no("Proceed with this file?", default=True):
+            if prompt_yes_no("Proceed to move this file, write metadata, and update index?", default=True):
                 return "capture", capture_path
             else:
                 print("Place the correct capture.txt and press Enter to check again...")
-                input()
+                read_input("")
                 continue
         else:
             print("capture.txt not found at the expected path.")
 
             # Offer using 'capture - test.txt' if present
             test_path = capture_path.parent / "capture - test.txt"
-            if test_path.exists():
-                size = test_path.stat().st_size
+            size = file_size_or_none(test_path)
+            if size is not None:
                 print(f"Found alternate file: '{test_path.name}' ({size} bytes).")
                 if size == 0:
                     print("Warning: alternate file is empty (0 bytes).")
                 if prompt_yes_no(f"Use '{test_path.name}' instead?", default=True):
                     return "capture", test_path
 
-            if prompt_yes_no("Retry after placing the file?", default=True):
+            # Retrying waits for a keypress, so never offer it non-interactively
+            if not NONINTERACTIVE and prompt_yes_no("Retry after placing the file?", default=True):
                 print("Press Enter when the file is in place...")
-                input()
+                read_input("")
                 continue
             # Offer metadata-only path
             if prompt_yes_no("Create only the metadata file without a capture?", default=False):
@@ -331,12 +481,39 @@ def ensure_capture_available(capture_path: Path) -> tuple[str, Optional[Path]]:
             sys.exit(1)
 
 
-def move_capture(capture_path: Path, destination_log: Path) -> None:
-    destination_log.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(capture_path), str(destination_log))
+def move_capture(capture_path: Path, destination_log: Path) -> int:
+    """Move the capture into place and return its size in bytes.
+
+    Tries a single os.replace first and only falls back to shutil.move when the
+    source and destination are on different filesystems.
+    """
+    ensure_dir(destination_log.parent)
+    size = capture_path.stat().st_size
+    try:
+        os.replace(capture_path, destination_log)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        import shutil  # Only needed for the rare cross-device move
+
+        shutil.move(capture_path, destination_log)
+    return size
 
 
-def write_metadata(metadata_path: Path, scenario_id: str, date_str: str, time_str: str, inputs: MetadataInputs) -> None:
+def write_metadata(
+    metadata_path: Path,
+    scenario_id: str,
+    date_str: str,
+    time_str: str,
+    inputs: MetadataInputs,
+    rollup_path: Optional[Path] = None,
+) -> None:
+    """Write the per-scenario metadata JSON.
+
+    If `rollup_path` is given, the same record is also appended as one line to
+    that JSONL file (index/metadata.jsonl) so consumers can read all metadata
+    sequentially from a single file.
+    """
     metadata = {
         "scenario_id": scenario_id,
         # Store in UTC-style string with 'Z' but do not convert local time
@@ -351,23 +528,56 @@ def write_metadata(metadata_path: Path, scenario_id: str, date_str: str, time_st
         "pas_level": inputs.pas_level,
     }
 
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        # Keep deterministic key order for readability
-        import json
+    # Keep deterministic key order and indentation for readability; serialize
+    # first so the file is written with a single unbuffered write
+    write_file_bytes(
+        metadata_path,
+        json.dumps(metadata, indent=2).encode("utf-8"),
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    )
+
+    if rollup_path is not None:
+        # Append-only, so re-processed scenarios add a newer record; readers
+        # should keep the last record per scenario_id. A single O_APPEND write
+        # keeps lines from concurrent runs from interleaving.
+        ensure_dir(rollup_path.parent)
+        line = json.dumps(metadata, separators=(",", ":")) + "\n"
+        write_file_bytes(rollup_path, line.encode("utf-8"), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
 
-        json.dump(metadata, f, indent=2)
 
+def write_file_bytes(path: Path, data: bytes, flags: int) -> None:
+    """Write `data` to `path` via os.open/os.write, bypassing the text layer."""
+    fd = os.open(path, flags | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-def offer_git_commit_push(project_root: Path, files: list[Path], scenario_id: str, test_type: str) -> None:
+
+def offer_git_commit_push(
+    project_root: Path,
+    files: list[Path],
+    scenario_id: str,
+    test_type: str,
+    before_commit: Optional[Callable[[], None]] = None,
+) -> None:
     """Offer to commit and push changes to git.
 
     Adds the provided files, commits with a standard message, and pushes.
+    `before_commit` runs once the user agrees, e.g. to flush pending writes.
+    Returns early without committing when none of the files have changes.
     Silently returns if git is not available or the directory is not a repo.
     """
     print()
     if not prompt_yes_no("Commit and push changes now?", default=False):
         print("Skipping git commit/push. Remember to commit and push later.")
         return
+    if before_commit is not None:
+        before_commit()
+
+    import subprocess  # Deferred: most sessions never commit
 
     try:
         # Ensure we are in the repo directory for git commands
@@ -376,109 +586,330 @@ def offer_git_commit_push(project_root: Path, files: list[Path], scenario_id: st
             print("No files to commit.")
             return
 
-        subprocess.run(["git", "-C", str(project_root), "add", "--"] + file_args, check=True)
+        # Skip add/commit/push entirely when none of the files changed.
+        # GIT_OPTIONAL_LOCKS=0 lets status skip its opportunistic index refresh.
+        status = subprocess.run(
+            ["git", "-C", str(project_root), "status", "--porcelain", "--"] + file_args,
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        )
+        if not status.stdout.strip():
+            print("No changes to commit.")
+            return
+
         commit_msg = f"Add scenario {scenario_id}: {test_type}"
-        subprocess.run(["git", "-C", str(project_root), "commit", "-m", commit_msg], check=False)
-        subprocess.run(["git", "-C", str(project_root), "push"], check=False)
-        print("Git commit/push attempted. Review output above for any errors.")
+        subprocess.run(["git", "-C", str(project_root), "add", "--"] + file_args, check=True)
+        # As before, push even if the commit fails (e.g. earlier unpushed commits)
+        failed = []
+        if subprocess.run(["git", "-C", str(project_root), "commit", "-m", commit_msg], check=False).returncode:
+            failed.append("commit")
+        if subprocess.run(["git", "-C", str(project_root), "push"], check=False).returncode:
+            failed.append("push")
+        if failed:
+            print(f"Git {' and '.join(failed)} failed. Review output above for errors.")
+        else:
+            print("Git commit/push completed.")
     except Exception as e:
         print(f"Git operation skipped or failed: {e}")
 
 
-def update_master_index(
-    index_path: Path,
+def build_index_row(
     date_str: str,
     time_str: str,
     scenario_id: str,
     test_type: str,
     log_path: Path,
     metadata_path: Path,
-) -> None:
-    # Calculate file_size and record_count
-    file_size = log_path.stat().st_size if log_path.exists() else 0
-    record_count = 0
-    if log_path.exists():
-        with open(log_path, "r", encoding="utf-8") as f:
-            record_count = sum(1 for line in f if line.strip())
-
-    # Prepare links (POSIX paths)
-    if REPO_GITHUB_PATH:
-        log_link = (
-            f"https://github.com/{REPO_GITHUB_PATH}/blob/main/" + log_path.as_posix()
-        )
-        metadata_link = (
-            f"https://github.com/{REPO_GITHUB_PATH}/blob/main/" + metadata_path.as_posix()
-        )
+) -> list:
+    """Build the master index row for a scenario, in INDEX_FIELDNAMES order."""
+    # Calculate file_size and record_count in a single read of the log
+    try:
+        file_size, record_count = scan_log(log_path)
+    except FileNotFoundError:
+        # Metadata-only scenario
+        file_size, record_count = 0, 0
+
+    log_name = f"{scenario_id}.log"
+    metadata_name = f"{scenario_id}.metadata.json"
+
+    # Prepare repo-relative links (logs/<date>/<file>, same layout as the
+    # backfill script). Names are fully determined by the date and scenario
+    # ID, so plain string joins need no path normalization.
+    if _LOGS_LINK_PREFIX:
+        date_prefix = _LOGS_LINK_PREFIX + date_str + "/"
+        log_link = date_prefix + log_name
+        metadata_link = date_prefix + metadata_name
     else:
         log_link = ""
         metadata_link = ""
 
-    index_path.parent.mkdir(parents=True, exist_ok=True)
-
-    fieldnames = [
-        "date",
-        "filename",
-        "file_size",
-        "record_count",
-        "metadata_file",
-        "created_at",
-        "test_description",
-        "log_link",
-        "metadata_link",
+    return [
+        date_str,
+        log_name,
+        file_size,
+        record_count,
+        metadata_name,
+        f"{date_str}T{time_str}:00Z",
+        test_type,
+        log_link,
+        metadata_link,
     ]
 
-    # Load existing rows if any
-    rows = []
-    if index_path.exists() and index_path.stat().st_size > 0:
+
+def load_index(index_path: Path) -> IndexBatch:
+    """Read the master index into memory for batched updates.
+
+    Rows are held in INDEX_FIELDNAMES order. An index whose columns are in a
+    different order is mapped by name and rewritten with the canonical header
+    on the next flush. Raises ValueError if it has columns the CLI does not
+    know about. The header's line ending (LF unless the file uses CRLF) is
+    reused for every row written back.
+    """
+    header = list(INDEX_FIELDNAMES)
+    rows: list[list] = []
+    # Taken before reading, so a write racing with the read shows up as a change
+    stamp = index_stamp(index_path)
+    size = stamp[1]
+    reordered = False
+    lineterminator = "\n"
+    if size > 0:
         with open(index_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                rows.append(row)
-
-    # Find existing row by filename (unique per scenario)
-    filename = f"{scenario_id}.log"
-    existing_idx = next((i for i, r in enumerate(rows) if r.get("filename") == filename), None)
-
-    # Preserve created_at if updating
-    created_at_value = f"{date_str}T{time_str}:00Z"
-    if existing_idx is not None:
-        existing = rows[existing_idx]
-        if existing.get("created_at"):
-            created_at_value = existing["created_at"]
-
-        # Update row in place
-        rows[existing_idx] = {
-            "date": date_str,
-            "filename": filename,
-            "file_size": file_size,
-            "record_count": record_count,
-            "metadata_file": f"{scenario_id}.metadata.json",
-            "created_at": created_at_value,
-            "test_description": test_type,
-            "log_link": log_link,
-            "metadata_link": metadata_link,
-        }
-    else:
-        # Append new row
-        rows.append(
-            {
-                "date": date_str,
-                "filename": filename,
-                "file_size": file_size,
-                "record_count": record_count,
-                "metadata_file": f"{scenario_id}.metadata.json",
-                "created_at": created_at_value,
-                "test_description": test_type,
-                "log_link": log_link,
-                "metadata_link": metadata_link,
-            }
-        )
+            first_line = f.readline()
+            if first_line.endswith("\r\n"):
+                lineterminator = "\r\n"
+            file_header = next(csv.reader([first_line]), header)
+            rows = [row for row in csv.reader(f) if row]
+        if file_header != header:
+            rows = reorder_index_columns(index_path, file_header, rows)
+            reordered = True
+    positions = {
+        row[COL_FILENAME]: i for i, row in enumerate(rows) if len(row) > COL_FILENAME
+    }
+    return IndexBatch(
+        path=index_path,
+        header=header,
+        rows=rows,
+        positions=positions,
+        stamp=stamp,
+        lineterminator=lineterminator,
+        rewrite=size == 0 or reordered,
+    )
+
 
-    # Write back all rows with header
-    with open(index_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+def reorder_index_columns(index_path: Path, header: list[str], rows: list[list]) -> list[list]:
+    """Map rows read under `header` onto INDEX_FIELDNAMES order by column name.
+
+    Columns missing from the file are left blank, as csv.DictWriter would.
+    Unknown columns raise ValueError instead of being dropped on the next write.
+    """
+    extra = [name for name in header if name not in INDEX_FIELDNAMES]
+    if extra:
+        raise ValueError(f"{index_path}: unexpected index column(s): {', '.join(extra)}")
+    source = [header.index(name) if name in header else None for name in INDEX_FIELDNAMES]
+    return [[row[i] if i is not None and i < len(row) else "" for i in source] for row in rows]
+
+
+def index_stamp(index_path: Path) -> tuple[int, int]:
+    """Return (st_mtime_ns, st_size) of the index, or (0, 0) if it is missing."""
+    try:
+        st = index_path.stat()
+    except FileNotFoundError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+def patch_index_row(batch: IndexBatch, row: list) -> None:
+    """Insert or replace a row in the in-memory index, preserving created_at."""
+    filename = row[COL_FILENAME]
+    idx = batch.positions.get(filename)
+    if idx is None:
+        batch.positions[filename] = len(batch.rows)
+        batch.rows.append(row)
+        batch.pending.append(format_index_row(row, batch.lineterminator))
+    else:
+        existing = batch.rows[idx]
+        if len(existing) > COL_CREATED_AT and existing[COL_CREATED_AT]:
+            row[COL_CREATED_AT] = existing[COL_CREATED_AT]
+        batch.rows[idx] = row
+        batch.rewrite = True
+    batch.touched[filename] = row
+    batch.dirty = True
+
+
+def flush_index(batch: IndexBatch) -> None:
+    """Write a batched index to disk if it has pending changes.
+
+    If the index changed on disk since the batch read it (another CLI run,
+    the backfill script), it is re-read under the lock and only the rows
+    this session touched are re-applied, so the other writer's changes are
+    kept. When the batch only added rows, they are appended to the existing
+    file in a single gathered write. Otherwise the whole index is rewritten
+    (see write_index_batch).
+    """
+    if not batch.dirty:
+        return
+    ensure_dir(batch.path.parent)
+    with index_lock(batch.path):
+        if index_stamp(batch.path) != batch.stamp:
+            reload_index_batch(batch)
+        if batch.rewrite:
+            write_index_batch(batch)
+        else:
+            append_index_batch(batch)
+
+
+def reload_index_batch(batch: IndexBatch) -> None:
+    """Re-read the index into `batch` and re-apply the rows it touched."""
+    fresh = load_index(batch.path)
+    for row in batch.touched.values():
+        patch_index_row(fresh, row)
+    batch.header = fresh.header
+    batch.rows = fresh.rows
+    batch.positions = fresh.positions
+    batch.stamp = fresh.stamp
+    batch.lineterminator = fresh.lineterminator
+    batch.rewrite = fresh.rewrite
+    batch.pending = fresh.pending
+    batch.touched = fresh.touched
+
+
+def append_index_batch(batch: IndexBatch) -> None:
+    """Append a batch's new rows to the index; caller holds index_lock.
+
+    Opens the index with O_APPEND, writes all pending rows joined into one
+    buffer (normally a single os.write), then fsyncs. Only the new rows'
+    bytes are written, regardless of index size.
+    """
+    chunks = batch.pending
+    fd = os.open(batch.path, os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    try:
+        end = os.lseek(fd, 0, os.SEEK_END)
+        if end > 0:
+            os.lseek(fd, end - 1, os.SEEK_SET)
+            if os.read(fd, 1) not in (b"\n", b"\r"):
+                chunks = [batch.lineterminator.encode("ascii")] + chunks
+        # One buffer rather than os.writev: writev rejects more than IOV_MAX
+        # (1024 on Linux) rows, which a large --batch run easily reaches
+        rest = memoryview(b"".join(chunks))
+        while rest:
+            rest = rest[os.write(fd, rest):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    batch.stamp = index_stamp(batch.path)
+    batch.pending = []
+    batch.touched = {}
+    batch.dirty = False
+
+
+def write_index_batch(batch: IndexBatch) -> None:
+    """Rewrite the index file from a batch; caller holds index_lock.
+
+    Writes to a tempfile next to the index and swaps it in with os.replace,
+    so an interrupted flush never leaves a truncated index.
+    """
+    tmp_path = batch.path.with_suffix(batch.path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(format_index_row(batch.header, batch.lineterminator))
+        for row in batch.rows:
+            f.write(format_index_row(row, batch.lineterminator))
+    os.replace(tmp_path, batch.path)
+    batch.stamp = index_stamp(batch.path)
+    batch.pending = []
+    batch.touched = {}
+    batch.dirty = False
+    batch.rewrite = False
+
+
+def scan_log(log_path: Path) -> tuple[int, int]:
+    """Return (file_size, record_count) for a log file from one read.
+
+    Reads in 1 MiB binary chunks, accumulating the byte total, counting line
+    breaks with bytes.count and subtracting blank or whitespace-only lines
+    found by the _BLANK_*LINE_RE patterns, so no per-line decoding is needed. The count
+    equals `sum(1 for line in f if line.strip())` over the file in text
+    mode: "\r\n", "\r" and "\n" all end a line, blank lines are not records,
+    and a final line without a line break still is.
+    """
+    size = 0
+    records = 0
+    partial = False  # the unterminated line carried into the next chunk has content
+    with open(log_path, "rb") as f:
+        buf = f.read(1 << 20)
+        while buf:
+            nxt = f.read(1 << 20)
+            if nxt and buf.endswith(b"\r"):
+                # Keep a "\r\n" split across two chunks together
+                buf, nxt = buf[:-1], b"\r" + nxt
+            size += len(buf)
+            if b"\r" not in buf or buf.count(b"\r") == buf.count(b"\r\n"):
+                # Only "\n" and "\r\n" breaks: count newlines
+                first = buf.find(b"\n")
+                if first > 0 and buf[first - 1] == 0x0D:
+                    first -= 1
+                end = buf.rfind(b"\n") + 1
+                breaks = buf.count(b"\n", first, end)
+                blank_line_re = _BLANK_LF_LINE_RE
+            elif b"\n" not in buf:
+                # Only bare "\r" breaks
+                first = buf.find(b"\r")
+                end = buf.rfind(b"\r") + 1
+                breaks = buf.count(b"\r", first, end)
+                blank_line_re = _BLANK_CR_LINE_RE
+            else:
+                cr, lf = buf.find(b"\r"), buf.find(b"\n")
+                first = min(cr, lf) if cr >= 0 and lf >= 0 else max(cr, lf)
+                end = max(buf.rfind(b"\r"), buf.rfind(b"\n")) + 1
+                breaks = (
+                    buf.count(b"\n", first, end)
+                    + buf.count(b"\r", first, end)
+                    - buf.count(b"\r\n", first, end)
+                )
+                blank_line_re = _BLANK_LINE_RE
+            if first < 0:
+                partial = partial or not _BLANK_RE.fullmatch(buf)
+            else:
+                # The first line may continue one started in the previous chunk
+                if partial or not _BLANK_RE.fullmatch(buf, 0, first):
+                    records += 1
+                # Lines after the first one, minus the blank ones
+                records += breaks - 1 - len(blank_line_re.findall(buf, first, end))
+                partial = not _BLANK_RE.fullmatch(buf, end)
+            buf = nxt
+    if partial:
+        records += 1
+    return size, records
+
+
+def format_index_row(row: list, lineterminator: str = "\n") -> bytes:
+    """Serialize one index row exactly as csv.writer would write it."""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator=lineterminator).writerow(row)
+    return buf.getvalue().encode("utf-8")
+
+
+@contextmanager
+def index_lock(index_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on the index while writing it.
+
+    The lock is taken on a sibling .lock file so it stays valid across the
+    os.replace used by rewrites. flush_index holds it while it checks whether
+    the index changed since the session read it, re-reads it if so, and
+    writes, so concurrent CLI runs on the same checkout keep each other's
+    rows. This is a no-op where fcntl is unavailable (Windows).
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(index_path.with_name(index_path.name + ".lock"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
 
 
 def collect_inputs(default_dt: datetime, prev: Optional[MetadataInputs]) -> tuple[str, str, MetadataInputs]:
@@ -537,109 +968,279 @@ def collect_inputs(default_dt: datetime, prev: Optional[MetadataInputs]) -> tupl
     return date_str, time_str, inputs
 
 
-def main() -> int:
+def parse_optional_number(
+    raw: str, cast: Callable[[str], float], min_value: float, max_value: float, name: str
+) -> Optional[float]:
+    """Parse a blank-or-numeric batch field, enforcing the same ranges as the prompts."""
+    raw = raw.strip()
+    if raw == "" or raw.lower() == "null":
+        return None
+    pattern = _INT_RE if cast is int else _NUMBER_RE
+    if not pattern.fullmatch(raw):
+        raise ValueError(f"{name} must be a number, got {raw!r}")
+    val = cast(raw)
+    if val < min_value or val > max_value:
+        raise ValueError(f"{name} out of range ({min_value} to {max_value}): {raw}")
+    return val
+
+
+def batch_record_inputs(record: dict) -> tuple[str, str, MetadataInputs]:
+    """Validate one batch record and convert it to (date, time, inputs)."""
+    date_str = (record.get("date") or "").strip()
+    time_str = (record.get("time") or "").strip()
+    try:
+        date_str = datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"date must be YYYY-MM-DD, got {date_str!r}") from None
+    try:
+        time_str = datetime.strptime(time_str, "%H:%M").strftime("%H:%M")
+    except ValueError:
+        raise ValueError(f"time must be HH:MM (24-hour), got {time_str!r}") from None
+
+    test_type = (record.get("test_type") or "").strip()
+    if not test_type:
+        raise ValueError("test_type cannot be empty")
+
+    pas_level = parse_optional_number(record.get("pas_level") or "", int, 0, 5, "pas_level")
+    if pas_level is None:
+        raise ValueError("pas_level is required")
+
+    regen = (record.get("slide_regen_mode_enabled") or "").strip().lower()
+    if regen not in {"", "y", "yes", "true", "1", "n", "no", "false", "0"}:
+        raise ValueError(f"slide_regen_mode_enabled must be yes/no, got {regen!r}")
+
+    inputs = MetadataInputs(
+        test_type=test_type,
+        notes=(record.get("notes") or "").strip(),
+        start_voltage=parse_optional_number(
+            record.get("start_voltage") or "", float, VOLTAGE_MIN, VOLTAGE_MAX, "start_voltage"
+        ),
+        resting_throttle=parse_optional_number(
+            record.get("resting_throttle") or "", float, THROTTLE_MIN, THROTTLE_MAX, "resting_throttle"
+        ),
+        controller_temperature=parse_optional_number(
+            record.get("controller_temperature") or "", int, CTRL_TEMP_MIN, CTRL_TEMP_MAX, "controller_temperature"
+        ),
+        motor_temperature=parse_optional_number(
+            record.get("motor_temperature") or "", int, MOTOR_TEMP_MIN, MOTOR_TEMP_MAX, "motor_temperature"
+        ),
+        # Same default as the interactive prompt
+        slide_regen_mode_enabled=regen not in {"n", "no", "false", "0"},
+        pas_level=pas_level,
+    )
+    return date_str, time_str, inputs
+
+
+def process_capture_many(project_root: Path, records: Iterable[dict]) -> int:
+    """Process many scenarios in one process, writing the index once.
+
+    Each record is a dict with the batch CSV columns: `date`, `time`,
+    `test_type` and `pas_level` are required; `scenario_id`, `notes`,
+    `capture` (path to a capture file, relative to the repo root) and the
+    baseline fields are optional. Records without `capture` are metadata-only.
+    Generated scenario IDs never reuse an existing metadata-only ID.
+
+    Returns the number of records processed. Raises ValueError for an invalid
+    record or one whose files cannot be written; rows for records processed
+    before it are still written.
+    """
+    index_path = project_root / "index" / "master_log_index.csv"
+    rollup_path = project_root / "index" / "metadata.jsonl"
+    index = load_index(index_path)
+    count = 0
+    try:
+        for num, record in enumerate(records, start=1):
+            try:
+                scenario_id, captured = process_batch_record(project_root, index, rollup_path, record)
+            except (ValueError, OSError) as e:
+                raise ValueError(f"record {num}: {e}") from None
+            count += 1
+            print(f"{scenario_id}: {'log + metadata' if captured else 'metadata only'}")
+    finally:
+        flush_index(index)
+    return count
+
+
+def process_batch_record(
+    project_root: Path, index: IndexBatch, rollup_path: Path, record: dict
+) -> tuple[str, bool]:
+    """Process one batch record; returns (scenario_id, whether a capture was moved)."""
+    date_str, time_str, inputs = batch_record_inputs(record)
+
+    logs_dir = logs_dir_for(project_root, date_str)
+    scenario_id = (record.get("scenario_id") or "").strip()
+    if not scenario_id:
+        log_ids, metadata_ids = scan_scenarios(logs_dir)
+        scenario_id = generate_scenario_id(
+            date_str, logs_dir, (log_ids | metadata_ids, metadata_ids)
+        )
+    else:
+        # The ID becomes a file name under logs/<date>/, so it must be
+        # a well-formed ID for this record's date
+        m = _SCENARIO_ID_RE.fullmatch(scenario_id)
+        if not m:
+            raise ValueError(f"scenario_id must be SCN_YYYY_MM_DD_XXX, got {scenario_id!r}")
+        if m.group(1) != date_str.replace("-", "_"):
+            raise ValueError(f"scenario_id {scenario_id} does not match date {date_str}")
+    log_path = logs_dir / f"{scenario_id}.log"
+    metadata_path = logs_dir / f"{scenario_id}.metadata.json"
+
+    capture = (record.get("capture") or "").strip()
+    if capture:
+        if log_path.exists():
+            raise ValueError(f"{log_path.name} already exists; refusing to overwrite it")
+        capture_path = project_root / capture
+        if not capture_path.is_file():
+            raise ValueError(f"capture file not found: {capture_path}")
+        move_capture(capture_path, log_path)
+    else:
+        ensure_dir(logs_dir)
+    write_metadata(metadata_path, scenario_id, date_str, time_str, inputs, rollup_path)
+    patch_index_row(
+        index,
+        build_index_row(date_str, time_str, scenario_id, inputs.test_type, log_path, metadata_path),
+    )
+    return scenario_id, bool(capture)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    batch = False
+    if argv:
+        import argparse  # Deferred: plain interactive runs take no arguments
+
+        parser = argparse.ArgumentParser(description="Process telemetry captures into logs/ with metadata and index updates.")
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="read CSV records (with a header row) from stdin instead of prompting",
+        )
+        batch = parser.parse_args(argv).batch
+
     project_root = get_project_root()
+    if batch:
+        try:
+            count = process_capture_many(project_root, csv.DictReader(sys.stdin))
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        except OSError as e:
+            # Record errors are reported as ValueError, so this is the index
+            print(f"Error: could not update {project_root / 'index' / 'master_log_index.csv'}: {e}")
+            return 1
+        print(f"Processed {count} record(s). Remember to commit and push the changes.")
+        return 0
+
     capture_path = project_root / "capture" / "capture.txt"
+    index_path = project_root / "index" / "master_log_index.csv"
+    rollup_path = project_root / "index" / "metadata.jsonl"
 
     prev_inputs: Optional[MetadataInputs] = None
 
-    while True:
-        now = datetime.now()
-        date_str, time_str, inputs = collect_inputs(now, prev_inputs)
-
-        # Choose existing metadata-only scenario or auto-generate next ID
-        logs_dir = project_root / "logs" / date_str
-        scenario_id = choose_or_generate_scenario_id(date_str, logs_dir)
-        log_path = logs_dir / f"{scenario_id}.log"
-        metadata_path = logs_dir / f"{scenario_id}.metadata.json"
-        index_path = project_root / "index" / "master_log_index.csv"
-
-        print("\nPlanned outputs:")
-        print(f"  Scenario ID: {scenario_id}")
-        print(f"  Log file:    {log_path}")
-        print(f"  Metadata:    {metadata_path}")
-        print(f"  Index CSV:   {index_path}")
-
-        # Determine capture availability/intent
-        print()
-        mode, selected_capture = ensure_capture_available(capture_path)
-
-        if mode == "capture":
+    # Index rows are patched in memory and written once when the session ends
+    # (or right before a git commit), instead of rewriting the CSV per log
+    try:
+        index = load_index(index_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    try:
+        while True:
+            now = datetime.now()
+            date_str, time_str, inputs = collect_inputs(now, prev_inputs)
+
+            # Choose existing metadata-only scenario or auto-generate next ID
+            logs_dir = logs_dir_for(project_root, date_str)
+            scenario_id = choose_or_generate_scenario_id(date_str, logs_dir)
+            log_path = logs_dir / f"{scenario_id}.log"
+            metadata_path = logs_dir / f"{scenario_id}.metadata.json"
+
             print("\nPlanned outputs:")
             print(f"  Scenario ID: {scenario_id}")
             print(f"  Log file:    {log_path}")
             print(f"  Metadata:    {metadata_path}")
             print(f"  Index CSV:   {index_path}")
 
-            if not prompt_yes_no("Proceed to move file, write metadata, and update index?", True):
-                print("Aborted by user before processing.")
-                return 1
-
-            # Execute full operations
-            # Move the chosen capture source (capture.txt or 'capture - test.txt')
-            move_capture(selected_capture if selected_capture else capture_path, log_path)
-            write_metadata(metadata_path, scenario_id, date_str, time_str, inputs)
-            update_master_index(
-                index_path,
-                date_str,
-                time_str,
-                scenario_id,
-                inputs.test_type,
-                log_path,
-                metadata_path,
-            )
-
-            # Summary
-            print("\nDone. Summary:")
-            size = log_path.stat().st_size if log_path.exists() else 0
-            print(f"  Moved capture -> {log_path.name} ({size} bytes)")
-            print(f"  Wrote metadata -> {metadata_path.name}")
-            print(f"  Updated index -> {index_path}")
-            print(f"  Created at: {date_str}T{time_str}:00Z")
-
-            # Offer git commit/push
-            offer_git_commit_push(
-                project_root,
-                files=[log_path, metadata_path, index_path],
-                scenario_id=scenario_id,
-                test_type=inputs.test_type,
-            )
+            # Determine capture availability/intent
+            print()
+            mode, selected_capture = ensure_capture_available(capture_path)
+
+            if mode == "capture":
+                # Execute full operations (already confirmed in ensure_capture_available)
+                # Move the chosen capture source (capture.txt or 'capture - test.txt')
+                size = move_capture(selected_capture if selected_capture else capture_path, log_path)
+                write_metadata(metadata_path, scenario_id, date_str, time_str, inputs, rollup_path)
+                patch_index_row(
+                    index,
+                    build_index_row(
+                        date_str,
+                        time_str,
+                        scenario_id,
+                        inputs.test_type,
+                        log_path,
+                        metadata_path,
+                    ),
+                )
+
+                # Summary
+                print("\nDone. Summary:")
+                print(f"  Moved capture -> {log_path.name} ({size} bytes)")
+                print(f"  Wrote metadata -> {metadata_path.name}")
+                print(f"  Updated index -> {index_path} (saved at end of session)")
+                print(f"  Created at: {date_str}T{time_str}:00Z")
+
+                # Offer git commit/push
+                offer_git_commit_push(
+                    project_root,
+                    files=[log_path, metadata_path, index_path, rollup_path],
+                    scenario_id=scenario_id,
+                    test_type=inputs.test_type,
+                    before_commit=lambda: flush_index(index),
+                )
 
-        else:
-            # Metadata-only path
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            write_metadata(metadata_path, scenario_id, date_str, time_str, inputs)
-            # Update index even without a log file (size and record_count will be 0)
-            update_master_index(
-                index_path,
-                date_str,
-                time_str,
-                scenario_id,
-                inputs.test_type,
-                log_path,
-                metadata_path,
-            )
-
-            print("\nDone (metadata only). Summary:")
-            print(f"  Wrote metadata -> {metadata_path}")
-            print("  Log move skipped (no capture.txt)")
-            print(f"  Updated index -> {index_path}")
-            print(f"  Created at: {date_str}T{time_str}:00Z")
-
-            # Offer git commit/push
-            offer_git_commit_push(
-                project_root,
-                files=[metadata_path, index_path],
-                scenario_id=scenario_id,
-                test_type=inputs.test_type,
-            )
-
-        # Save inputs for potential reuse
-        prev_inputs = inputs
-
-        # Ask to process another log in the same session
-        if not prompt_yes_no("\nProcess another log?", default=False):
-            break
+            else:
+                # Metadata-only path
+                ensure_dir(logs_dir)
+                write_metadata(metadata_path, scenario_id, date_str, time_str, inputs, rollup_path)
+                # Update index even without a log file (size and record_count will be 0)
+                patch_index_row(
+                    index,
+                    build_index_row(
+                        date_str,
+                        time_str,
+                        scenario_id,
+                        inputs.test_type,
+                        log_path,
+                        metadata_path,
+                    ),
+                )
+
+                print("\nDone (metadata only). Summary:")
+                print(f"  Wrote metadata -> {metadata_path}")
+                print("  Log move skipped (no capture.txt)")
+                print(f"  Updated index -> {index_path} (saved at end of session)")
+                print(f"  Created at: {date_str}T{time_str}:00Z")
+
+                # Offer git commit/push
+                offer_git_commit_push(
+                    project_root,
+                    files=[metadata_path, index_path, rollup_path],
+                    scenario_id=scenario_id,
+                    test_type=inputs.test_type,
+                    before_commit=lambda: flush_index(index),
+                )
+
+            # Save inputs for potential reuse
+            prev_inputs = inputs
+
+            # Ask to process another log in the same session
+            if not prompt_yes_no("\nProcess another log?", default=False):
+                break
+    finally:
+        # Also runs on Ctrl+C and aborts, so completed logs are never lost
+        flush_index(index)
 
     return 0
 
@@ -650,5 +1251,9 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\nInterrupted by user.")
         sys.exit(130)
+    except OSError as e:
+        # e.g. the end-of-session index flush failed
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Materialize index/metadata.jsonl as a Parquet file for analytical queries.
+
+Usage:
+    python cli/rollup_metadata.py
+
+Reads the append-only metadata rollup written by the interactive CLI, keeps
+the most recent record for each scenario_id, and writes
+index/metadata.parquet. Requires the optional `pyarrow` package.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def main() -> int:
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError:
+        print("Error: pyarrow is required for the Parquet rollup (pip install pyarrow).")
+        return 1
+
+    rollup_path = PROJECT_ROOT / "index" / "metadata.jsonl"
+    if not rollup_path.exists() or rollup_path.stat().st_size == 0:
+        print(f"No metadata rollup found or it is empty: {rollup_path}")
+        return 0
+
+    # Later lines supersede earlier ones for the same scenario
+    records: dict[str, dict] = {}
+    with open(rollup_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                records[record["scenario_id"]] = record
+
+    parquet_path = rollup_path.with_suffix(".parquet")
+    pq.write_table(pa.Table.from_pylist(list(records.values())), parquet_path)
+
+    print(f"Wrote {len(records)} scenario(s) to {parquet_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())